@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from enum import Enum
 
 import numpy as np
@@ -76,7 +75,8 @@ def get_fusion_network_from_graph(
     """
     use_rustworkx = isinstance(graph, RXGraphState)
 
-    adjdict = deepcopy({n: adj for n, adj in graph.adjacency()})
+    # only the neighbor keys are mutated below, so a shallow copy of each adjacency dict is enough
+    adjdict = {n: dict(adj) for n, adj in graph.adjacency()}
 
     number_of_edges = graph.number_of_edges()
     resource_list = []
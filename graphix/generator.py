@@ -4,9 +4,10 @@ MBQC pattern generator
 """
 
 
+import networkx as nx
 import numpy as np
 from graphix.pattern import Pattern
-from graphix.gflow import flow, gflow, get_layers, find_odd_neighbor
+from graphix.gflow import flow, gflow, get_layers
 
 
 def generate_from_graph(graph, angles, inputs, outputs, meas_planes=None):
@@ -53,7 +54,8 @@ def generate_from_graph(graph, angles, inputs, outputs, meas_planes=None):
         constructed pattern.
     """
     assert len(inputs) == len(outputs)
-    measuring_nodes = list(set(graph.nodes) - set(outputs) - set(inputs))
+    nodes = set(graph.nodes)
+    measuring_nodes = list(nodes - set(outputs) - set(inputs))
 
     if meas_planes is None:
         meas_planes = {i: "XY" for i in measuring_nodes}
@@ -65,20 +67,20 @@ def generate_from_graph(graph, angles, inputs, outputs, meas_planes=None):
         depth, layers = get_layers(l_k)
         pattern = Pattern(input_nodes=inputs, output_nodes=outputs, width=len(inputs))
         pattern.seq = [["N", i] for i in inputs]
-        for i in set(graph.nodes) - set(inputs):
+        for i in nodes - set(inputs):
             pattern.seq.append(["N", i])
         for e in graph.edges:
             pattern.seq.append(["E", e])
-        measured = []
+        measured = set()
         for i in range(depth, 0, -1):  # i from depth, depth-1, ... 1
             for j in layers[i]:
-                measured.append(j)
+                measured.add(j)
                 pattern.seq.append(["M", j, "XY", angles[j], [], []])
-                for k in set(graph.neighbors(f[j])) - set([j]):
+                for k in graph.neighbors(f[j]):
                     if k not in measured:
                         pattern.seq.append(["Z", k, [j]])
                 pattern.seq.append(["X", f[j], [j]])
-        pattern.Nnode = len(graph.nodes)
+        pattern.Nnode = len(nodes)
     else:
         # no flow found - we try gflow
         g, l_k = gflow(graph, set(inputs), set(outputs), meas_planes=meas_planes)
@@ -87,21 +89,31 @@ def generate_from_graph(graph, angles, inputs, outputs, meas_planes=None):
             depth, layers = get_layers(l_k)
             pattern = Pattern(input_nodes=inputs, output_nodes=outputs, width=len(inputs))
             pattern.seq = [["N", i] for i in inputs]
-            for i in set(graph.nodes) - set(inputs):
+            for i in nodes - set(inputs):
                 pattern.seq.append(["N", i])
             for e in graph.edges:
                 pattern.seq.append(["E", e])
-            remaining = set(measuring_nodes)
-            for i in range(depth, 0, -1):  # i from depth, depth-1, ... 1
-                for j in layers[i]:
-                    pattern.seq.append(["M", j, "XY", angles[j], [], []])
-                    remaining = remaining - set([j])
-                    odd_neighbors = find_odd_neighbor(graph, remaining, set(g[j]))
-                    for k in odd_neighbors:
-                        pattern.seq.append(["Z", k, [j]])
-                    for k in set(g[j]) - set([j]):
+            meas_order = [j for i in range(depth, 0, -1) for j in layers[i]]  # i from depth, depth-1, ... 1
+            # odd neighbors of all correction sets at once, as the GF(2) product of
+            # the adjacency matrix and the indicator matrix of the correction sets.
+            node_list = list(graph.nodes)
+            node_index = {node: i for i, node in enumerate(node_list)}
+            adj_mat = nx.to_numpy_array(graph, nodelist=node_list, dtype=int)
+            corrections = np.zeros((len(node_list), len(meas_order)), dtype=int)
+            for col, j in enumerate(meas_order):
+                corrections[[node_index[k] for k in g[j]], col] = 1
+            odd_neighbors = (adj_mat @ corrections) % 2
+            not_measured = set(nodes)
+            for col, j in enumerate(meas_order):
+                pattern.seq.append(["M", j, "XY", angles[j], [], []])
+                not_measured.discard(j)
+                for k in np.flatnonzero(odd_neighbors[:, col]):
+                    if node_list[k] in not_measured:
+                        pattern.seq.append(["Z", node_list[k], [j]])
+                for k in g[j]:
+                    if k != j:
                         pattern.seq.append(["X", k, [j]])
-            pattern.Nnode = len(graph.nodes)
+            pattern.Nnode = len(nodes)
         else:
             raise ValueError("no flow or gflow found")
 
@@ -130,19 +130,18 @@ def gflowaux(
         adj_mat.remove_col(node_order_col.index(node))
         node_order_col.remove(node)
 
+    # measurement planes of the rows and column positions in adj_mat_row_reduced of the row nodes,
+    # collected once per layer so that the columns of b are assembled with plane masks
+    row_planes = np.array([meas_planes[node] for node in node_order_row], dtype=str)
+    node_index = {node: i for i, node in enumerate(node_order_list)}
+    row_cols = np.array([node_index[node] for node in node_order_row], dtype=int)
     b = MatGF2(np.zeros((adj_mat.data.shape[0], len(non_output)), dtype=int))
-    for i_row in range(len(node_order_row)):
-        node = node_order_row[i_row]
-        vec = MatGF2(np.zeros(len(node_order_row), dtype=int))
-        if meas_planes[node] == "XY":
-            vec.data[i_row] = 1
-        elif meas_planes[node] == "XZ":
-            vec.data[i_row] = 1
-            vec_add = adj_mat_row_reduced.data[:, node_order_list.index(node)]
-            vec = vec + vec_add
-        elif meas_planes[node] == "YZ":
-            vec.data = adj_mat_row_reduced.data[:, i_row].reshape(vec.data.shape)
-        b.data[:, i_row] = vec.data
+    # XZ and YZ: the neighborhood of the measured node itself
+    odd_rows = np.flatnonzero(np.isin(row_planes, ["XZ", "YZ"]))
+    b.data[:, odd_rows] = adj_mat_row_reduced.data[:, row_cols[odd_rows]]
+    # XY and XZ: the measured node
+    self_rows = np.flatnonzero(np.isin(row_planes, ["XY", "XZ"]))
+    b.data[self_rows, self_rows] = 1
 
     adj_mat, b, _, col_pertumutation = adj_mat.forward_eliminate(b)
     x, kernels = adj_mat.backward_substitute(b)
@@ -159,7 +158,7 @@ def gflowaux(
             sol_index = sol.nonzero()[0]
             g[non_out_node] = set(node_order_col[col_pertumutation[i]] for i in sol_index)
             if meas_planes[non_out_node] in ["XZ", "YZ"]:
-                g[non_out_node] |= {non_out_node}
+                g[non_out_node].add(non_out_node)
 
         elif mode == "all":
             g[non_out_node] = set()
@@ -172,9 +171,9 @@ def gflowaux(
                 sol_index = sol.nonzero()[0]
                 g_i = set(node_order_col[col_pertumutation[i]] for i in sol_index)
                 if meas_planes[non_out_node] in ["XZ", "YZ"]:
-                    g_i |= {non_out_node}
+                    g_i.add(non_out_node)
 
-                g[non_out_node] |= {frozenset(g_i)}
+                g[non_out_node].add(frozenset(g_i))
 
         elif mode == "abstract":
             g[non_out_node] = dict()
@@ -187,7 +186,7 @@ def gflowaux(
                 g[non_out_node][non_out_node] = sp.true
 
         l_k[non_out_node] = k
-        corrected_nodes |= {non_out_node}
+        corrected_nodes.add(non_out_node)
 
     if len(corrected_nodes) == 0:
         if output == nodes:
@@ -290,16 +289,23 @@ def flowaux(nodes, edges, input, output, v_c, f, l_k, k):
     """
     v_out_prime = set()
     c_prime = set()
+    # collect the neighborhoods in a single pass over the edges,
+    # instead of scanning all edges for every correction candidate
+    neighbors = {node: set() for node in nodes}
+    for u, v in edges:
+        neighbors[u].add(v)
+        neighbors[v].add(u)
+    non_output = nodes - output
 
     for q in v_c:
-        N = search_neighbor(q, edges)
-        p_set = N & (nodes - output)
+        N = neighbors[q]
+        p_set = N & non_output
         if len(p_set) == 1:
             p = list(p_set)[0]
             f[p] = q
             l_k[p] = k
-            v_out_prime = v_out_prime | {p}
-            c_prime = c_prime | {q}
+            v_out_prime.add(p)
+            c_prime.add(q)
     # determine whether there exists flow
     if not v_out_prime:
         if output == nodes:
@@ -336,9 +342,9 @@ def search_neighbor(node, edges):
     N = set()
     for edge in edges:
         if node == edge[0]:
-            N = N | {edge[1]}
+            N.add(edge[1])
         elif node == edge[1]:
-            N = N | {edge[0]}
+            N.add(edge[0])
     return N
 
 
@@ -414,10 +420,12 @@ def find_odd_neighbor(graph, candidate, vertices):
     out : list
         list of indices for odd neighbor of set `vertices`.
     """
-    out = []
-    for c in candidate:
-        if np.mod(len(set(graph.neighbors(c)) ^ vertices), 2) == 1:
-            out.append(c)
+    # a node is an odd neighbor iff it appears in an odd number of neighborhoods of `vertices`,
+    # so the odd neighborhood is the symmetric difference of those neighborhoods.
+    odd_neighbors = set()
+    for v in vertices:
+        odd_neighbors ^= set(graph.neighbors(v))
+    out = [c for c in candidate if c in odd_neighbors]
     return out
 
 
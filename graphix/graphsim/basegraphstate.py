@@ -440,9 +440,7 @@ class BaseGraphState(ABC):
         self.flip_fill(node1)
         self.flip_fill(node2)
         # local complement along edge between node1, node2
-        self.local_complement(node1)
-        self.local_complement(node2)
-        self.local_complement(node1)
+        self.pivot(node1, node2)
         for i in iter(set(self.neighbors(node1)) & set(self.neighbors(node2))):
             self.flip_sign(i)
         if sg1:
@@ -469,6 +467,26 @@ class BaseGraphState(ABC):
         """
         raise NotImplementedError
 
+    def pivot(self, node1: int, node2: int) -> None:
+        """Perform pivoting of a graph, i.e. local complementation along the edge
+        between node1 and node2. This is equivalent to the local complementation
+        on node1, node2 and node1 in this order.
+
+        Parameters
+        ----------
+        node1, node2 : int
+            connected graph nodes to perform pivoting
+
+        Returns
+        ----------
+        None
+        """
+        if (node1, node2) not in self.edges and (node2, node1) not in self.edges:
+            raise ValueError("nodes must be connected by an edge")
+        self.local_complement(node1)
+        self.local_complement(node2)
+        self.local_complement(node1)
+
     def equivalent_fill_node(self, node: int) -> int:
         """Fill the chosen node by graph transformation rules E1 and E2,
         If the selected node is hollow and isolated, it cannot be filled
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from itertools import combinations, product
+
 import networkx as nx
 from networkx.classes.reportviews import EdgeView, NodeView
 
@@ -92,10 +94,35 @@ class NXGraphState(BaseGraphState):
         return self._graph.adjacency()
 
     def local_complement(self, node):
-        g = self.subgraph(list(self.neighbors(node)))
-        g_new = nx.complement(g)
-        self.remove_edges_from(g.edges)
-        self.add_edges_from(g_new.edges)
+        # toggle the edges among the neighbors in place,
+        # instead of building the complement of the neighborhood subgraph
+        adj = self._graph.adj
+        for u, v in combinations(list(adj[node]), 2):
+            if v in adj[u]:
+                self._graph.remove_edge(u, v)
+            else:
+                self._graph.add_edge(u, v)
+
+    def pivot(self, node1, node2):
+        adj = self._graph.adj
+        if node2 not in adj[node1]:
+            raise ValueError("nodes must be connected by an edge")
+        nb1 = set(adj[node1]) - {node2}
+        nb2 = set(adj[node2]) - {node1}
+        common = nb1 & nb2
+        only1 = nb1 - nb2
+        only2 = nb2 - nb1
+        # complement the edges between the three neighbor classes,
+        # then exchange the neighborhoods of node1 and node2
+        toggled = list(product(common, only1)) + list(product(common, only2)) + list(product(only1, only2))
+        for i in only1 | only2:
+            toggled.append((node1, i))
+            toggled.append((node2, i))
+        for u, v in toggled:
+            if v in adj[u]:
+                self._graph.remove_edge(u, v)
+            else:
+                self._graph.add_edge(u, v)
 
     def get_isolates(self) -> list[int]:
         return list(nx.isolates(self.graph))
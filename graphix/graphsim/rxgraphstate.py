@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from itertools import combinations
+
 from .basegraphstate import RUSTWORKX_INSTALLED, BaseGraphState
 from .rxgraphviews import EdgeList, NodeList
 
@@ -59,7 +61,8 @@ class RXGraphState(BaseGraphState):
 
     def neighbors(self, node) -> iter:
         nidx = self.nodes.get_node_index(node)
-        return iter(self._graph.neighbors(nidx))
+        # rustworkx returns node indices, which are mapped back to node numbers
+        return iter([self._graph[i][0] for i in self._graph.neighbors(nidx)])
 
     def subgraph(self, nodes: list) -> rx.PyGraph:
         nidx = [self.nodes.get_node_index(n) for n in nodes]
@@ -80,8 +83,8 @@ class RXGraphState(BaseGraphState):
             nidx = self.nodes.get_node_index(n)
             adjacency_dict = self._graph.adj(nidx)
             new_adjacency_dict = {}
-            for nidx, _ in adjacency_dict.items():
-                new_adjacency_dict[self.nodes.get_node_index(nidx)] = {}  # replace None with {}
+            for adj_idx in adjacency_dict.keys():
+                new_adjacency_dict[self._graph[adj_idx][0]] = {}  # replace None with {}
             ret.append((n, new_adjacency_dict))
         return iter(ret)
 
@@ -111,34 +114,27 @@ class RXGraphState(BaseGraphState):
             self.nodes.add_node(self._graph[nidx][0], self._graph[nidx][1], nidx)
 
     def add_edges_from(self, edges):
-        for u, v in edges:
-            # adding edges may add new nodes
-            if u not in self.nodes:
-                nidx = self._graph.add_node((u, {"loop": False, "sign": False, "hollow": False}))
-                self.nodes.add_node(self._graph[nidx][0], self._graph[nidx][1], nidx)
-            if v not in self.nodes:
-                nidx = self._graph.add_node((v, {"loop": False, "sign": False, "hollow": False}))
-                self.nodes.add_node(self._graph[nidx][0], self._graph[nidx][1], nidx)
-            uidx = self.nodes.get_node_index(u)
-            vidx = self.nodes.get_node_index(v)
-            eidx = self._graph.add_edge(uidx, vidx, None)
-            self.edges.add_edge((self._graph[uidx][0], self._graph[vidx][0]), None, eidx)
+        edges = list(edges)
+        # adding edges may add new nodes
+        new_nodes = list(dict.fromkeys(n for edge in edges for n in edge if n not in self.nodes))
+        self.add_nodes_from(new_nodes)
+        # insert all edges into the rustworkx graph in one call
+        edge_indices = self._graph.add_edges_from(
+            [(self.nodes.get_node_index(u), self.nodes.get_node_index(v), None) for u, v in edges]
+        )
+        for (u, v), eidx in zip(edges, edge_indices):
+            self.edges.add_edge((u, v), None, eidx)
 
     def local_complement(self, node):
-        g = self.subgraph(list(self.neighbors(node)))
-        g_new = rx.complement(g)
-        g_edge_list = []
-        for uidx, vidx in g.edge_list():
-            u = g.get_node_data(uidx)[0]
-            v = g.get_node_data(vidx)[0]
-            g_edge_list.append((u, v))
-        g_new_eidx_list = []
-        for uidx, vidx in g_new.edge_list():
-            u = g_new.get_node_data(uidx)[0]
-            v = g_new.get_node_data(vidx)[0]
-            g_new_eidx_list.append((u, v))
-        self.remove_edges_from(g_edge_list)
-        self.add_edges_from(g_new_eidx_list)
+        # toggle the edges among the neighbors in place,
+        # instead of building the complement of the neighborhood subgraph
+        for u, v in combinations(list(self.neighbors(node)), 2):
+            if (u, v) in self.edges:
+                self.remove_edge(u, v)
+            elif (v, u) in self.edges:
+                self.remove_edge(v, u)
+            else:
+                self.add_edges_from([(u, v)])
 
     def get_isolates(self) -> list[int]:
         # return list(rx.isolates(self.graph))  # will work with rustworkx>=0.14.0
@@ -164,22 +164,14 @@ class Pattern:
             elif self.seq[i][0] == "X" and ("X" in filter):
                 count += 1
                 # remove duplicates
-                _domain = np.array(self.seq[i][2])
-                uind = np.unique(_domain)
-                unique_domain = []
-                for ind in uind:
-                    if np.mod(np.count_nonzero(_domain == ind), 2) == 1:
-                        unique_domain.append(ind)
+                uind, counts = np.unique(np.array(self.seq[i][2]), return_counts=True)
+                unique_domain = list(uind[counts & 1 == 1])
                 print(f"X byproduct, node = {self.seq[i][1]}, domain = {unique_domain}")
             elif self.seq[i][0] == "Z" and ("Z" in filter):
                 count += 1
                 # remove duplicates
-                _domain = np.array(self.seq[i][2])
-                uind = np.unique(_domain)
-                unique_domain = []
-                for ind in uind:
-                    if np.mod(np.count_nonzero(_domain == ind), 2) == 1:
-                        unique_domain.append(ind)
+                uind, counts = np.unique(np.array(self.seq[i][2]), return_counts=True)
+                unique_domain = list(uind[counts & 1 == 1])
                 print(f"Z byproduct, node = {self.seq[i][1]}, domain = {unique_domain}")
             elif self.seq[i][0] == "C" and ("C" in filter):
                 count += 1
@@ -235,10 +227,12 @@ class Pattern:
             else:
                 raise ValueError(f"command {cmd} is invalid!")
         nodes = dict()
+        output_nodes = set(self.output_nodes)
+        input_nodes = set(self.input_nodes)
         for index in node_prop.keys():
-            if index in self.output_nodes:
+            if index in output_nodes:
                 node_prop[index]["output"] = True
-            if index in self.input_nodes:
+            if index in input_nodes:
                 node_prop[index]["input"] = True
             node = CommandNode(index, **node_prop[index])
             nodes[index] = node
@@ -568,7 +562,7 @@ class Pattern:
         moved_X = 0  # number of moved X
         target = self._find_op_to_be_moved("X", rev=True, skipnum=moved_X)
         while target != "end":
-            if (target == len(self.seq) - 1) or (self.seq[target + 1] == "X"):
+            if (target == len(self.seq) - 1) or (self.seq[target + 1][0] == "X"):
                 moved_X += 1
                 target = self._find_op_to_be_moved("X", rev=True, skipnum=moved_X)
                 continue
@@ -589,7 +583,7 @@ class Pattern:
         moved_Z = 0  # number of moved Z
         target = self._find_op_to_be_moved("Z", rev=True, skipnum=moved_Z)
         while target != "end":
-            if (target == len(self.seq) - 1) or (self.seq[target + 1][0] == ("X" or "Z")):
+            if (target == len(self.seq) - 1) or (self.seq[target + 1][0] in ["X", "Z"]):
                 moved_Z += 1
                 target = self._find_op_to_be_moved("Z", rev=True, skipnum=moved_Z)
                 continue
@@ -609,7 +603,7 @@ class Pattern:
         moved_E = 0
         target = self._find_op_to_be_moved("E", skipnum=moved_E)
         while target != "end":
-            if (target == 0) or (self.seq[target - 1][0] == ("N" or "E")):
+            if (target == 0) or (self.seq[target - 1][0] in ["N", "E"]):
                 moved_E += 1
                 target = self._find_op_to_be_moved("E", skipnum=moved_E)
                 continue
@@ -689,17 +683,18 @@ class Pattern:
         measured = self.results.keys()
         dependency = self.update_dependency(measured, dependency)
         not_measured = set()
+        output_nodes = set(self.output_nodes)
         for cmd in self.seq:
             if cmd[0] == "N":
-                if not cmd[1] in self.output_nodes:
-                    not_measured = not_measured | {cmd[1]}
+                if not cmd[1] in output_nodes:
+                    not_measured.add(cmd[1])
         l_k = dict()
         k = 0
         while not_measured:
             l_k[k] = set()
             for i in not_measured:
                 if not dependency[i]:
-                    l_k[k] = l_k[k] | {i}
+                    l_k[k].add(i)
             dependency = self.update_dependency(l_k[k], dependency)
             not_measured -= l_k[k]
             k += 1
@@ -748,26 +743,31 @@ class Pattern:
         nodes, edges = self.get_graph()
         nodes = set(nodes)
         edges = set(edges)
+        # not activated edges connected to each node, updated as nodes are measured
+        connected = {i: set() for i in nodes}
+        for edge in edges:
+            connected[edge[0]].add(edge)
+            connected[edge[1]].add(edge)
         not_measured = nodes - set(self.output_nodes)
         dependency = self._get_dependency()
         dependency = self.update_dependency(self.results.keys(), dependency)
         meas_order = []
-        removable_edges = set()
         while not_measured:
             min_edges = len(nodes) + 1
             next_node = -1
             for i in not_measured:
                 if not dependency[i]:
-                    connected_edges = self.connected_edges(i, edges)
-                    if min_edges > len(connected_edges):
-                        min_edges = len(connected_edges)
+                    if min_edges > len(connected[i]):
+                        min_edges = len(connected[i])
                         next_node = i
-                        removable_edges = connected_edges
             assert next_node > -1
             meas_order.append(next_node)
             dependency = self.update_dependency({next_node}, dependency)
             not_measured -= {next_node}
-            edges -= removable_edges
+            for edge in connected[next_node]:
+                pair = edge[1] if edge[0] == next_node else edge[0]
+                connected[pair].discard(edge)
+            connected[next_node] = set()
         return meas_order
 
     def get_measurement_order_from_flow(self):
@@ -1098,32 +1098,43 @@ class Pattern:
         meas_commands : list of command
             list of measurement ('M') commands
         """
-        prepared = []
-        measured = []
+        if not self.is_standard():
+            self.standardize()
+        # neighbors of each node in the order of the E commands, collected in a single pass
+        # instead of scanning the E commands with connected_nodes for every measurement
+        neighbors = dict()
+        for cmd in self.seq:
+            if cmd[0] == "E":
+                neighbors.setdefault(cmd[1][0], []).append(cmd[1][1])
+                neighbors.setdefault(cmd[1][1], []).append(cmd[1][0])
+        prepared = set()
+        measured = set()
         new = []
         for cmd in meas_commands:
             node = cmd[1]
             if node not in prepared:
                 new.append(["N", node])
-                prepared.append(node)
-            node_list = self.connected_nodes(node, measured)
-            for add_node in node_list:
+                prepared.add(node)
+            for add_node in neighbors.get(node, []):
+                if add_node in measured:
+                    continue
                 if add_node not in prepared:
                     new.append(["N", add_node])
-                    prepared.append(add_node)
+                    prepared.add(add_node)
                 new.append(["E", (node, add_node)])
             new.append(cmd)
-            measured.append(node)
+            measured.add(node)
 
         # add isolated nodes
         for cmd in self.seq:
             if cmd[0] == "N":
                 if not cmd[1] in prepared:
                     new.append(["N", cmd[1]])
+        output_nodes = set(self.output_nodes)
         for cmd in self.seq:
             if cmd[0] == "E":
-                if cmd[1][0] in self.output_nodes:
-                    if cmd[1][1] in self.output_nodes:
+                if cmd[1][0] in output_nodes:
+                    if cmd[1][1] in output_nodes:
                         new.append(cmd)
 
         # add Clifford nodes
@@ -1613,13 +1624,13 @@ class LocalPattern:
         for index, node in self.nodes.items():
             dependent_node_dicts = node.get_signal_destination_dict()
             for dependent_node in dependent_node_dicts["Ms"]:
-                self.signal_destination[dependent_node]["Ms"] |= {index}
+                self.signal_destination[dependent_node]["Ms"].add(index)
             for dependent_node in dependent_node_dicts["Mt"]:
-                self.signal_destination[dependent_node]["Mt"] |= {index}
+                self.signal_destination[dependent_node]["Mt"].add(index)
             for dependent_node in dependent_node_dicts["X"]:
-                self.signal_destination[dependent_node]["X"] |= {index}
+                self.signal_destination[dependent_node]["X"].add(index)
             for dependent_node in dependent_node_dicts["Z"]:
-                self.signal_destination[dependent_node]["Z"] |= {index}
+                self.signal_destination[dependent_node]["Z"].add(index)
 
     def shift_signals(self):
         """Shift signals to the back based on signal destinations."""
@@ -1627,6 +1638,9 @@ class LocalPattern:
         for node_index in self.morder + self.output_nodes:
             signal = self.nodes[node_index].Mprop[3]
             self.nodes[node_index].Mprop[3] = []
+            # output nodes and nodes without t-domain have nothing to shift
+            if not signal:
+                continue
             for signal_label, destinated_nodes in self.signal_destination[node_index].items():
                 for destinated_node in destinated_nodes:
                     node = self.nodes[destinated_node]
@@ -1799,9 +1813,10 @@ def measure_pauli(pattern, leave_input, copy=False, use_rustworkx=False):
     # measure (remove) isolated nodes. if they aren't Pauli measurements,
     # measuring one of the results with probability of 1 should not occur as was possible above for Pauli measurements,
     # which means we can just choose s=0. We should not remove output nodes even if isolated.
-    isolates = graph_state.get_isolates()
+    isolates = set(graph_state.get_isolates())
+    output_nodes = set(pattern.output_nodes)
     for node in non_pauli_meas:
-        if (node in isolates) and (node not in pattern.output_nodes):
+        if (node in isolates) and (node not in output_nodes):
             graph_state.remove_node(node)
             results[node] = 0
 
@@ -1814,7 +1829,7 @@ def measure_pauli(pattern, leave_input, copy=False, use_rustworkx=False):
         new_seq.append(["E", edge])
     for cmd in pattern.seq:
         if cmd[0] == "M":
-            if cmd[1] in list(graph_state.nodes):
+            if cmd[1] in graph_state.nodes:
                 cmd_new = deepcopy(cmd)
                 new_clifford_ = vops[cmd[1]]
                 if len(cmd_new) == 7:
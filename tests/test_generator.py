@@ -49,6 +49,26 @@ class TestGenerator(unittest.TestCase):
             inner_product = np.dot(results[i].flatten(), results[j].flatten().conjugate())
             np.testing.assert_almost_equal(abs(inner_product), 1)
 
+    def test_pattern_generation_determinism_gflow_with_z_corrections(self):
+        # graph without flow, where the odd neighbors of the correction sets include unmeasured nodes
+        graph = nx.Graph([(0, 1), (0, 4), (0, 5), (1, 3), (1, 4), (1, 5), (2, 3), (2, 4)])
+        inputs = {0, 1}
+        outputs = {4, 5}
+        angles = np.random.randn(6)
+        meas_planes = {i: "XY" for i in range(4)}
+        results = []
+        repeats = 3  # for testing the determinism of a pattern
+        for _ in range(repeats):
+            pattern = generate_from_graph(graph, angles, list(inputs), list(outputs), meas_planes=meas_planes)
+            pattern.standardize()
+            pattern.minimize_space()
+            state = pattern.simulate_pattern()
+            results.append(state)
+        combinations = [(0, 1), (0, 2), (1, 2)]
+        for i, j in combinations:
+            inner_product = np.dot(results[i].flatten(), results[j].flatten().conjugate())
+            np.testing.assert_almost_equal(abs(inner_product), 1)
+
     def test_pattern_generation_flow(self):
         nqubits = 3
         depth = 2
@@ -3,7 +3,7 @@ import unittest
 import networkx as nx
 import numpy as np
 
-from graphix.gflow import flow, gflow
+from graphix.gflow import find_odd_neighbor, flow, gflow
 
 
 class TestGflow(unittest.TestCase):
@@ -123,6 +123,20 @@ class TestGflow(unittest.TestCase):
         self.assertIsNone(g)
         self.assertIsNone(l_k)
 
+    def test_gflow_with_YZ_plane_after_output(self):
+        # the output node precedes the YZ-plane node in the node order
+        graph = nx.Graph([(0, 1)])
+        g, l_k = gflow(graph, set(), {0}, {1: "YZ"})
+        self.assertEqual(g, {1: {1}})
+        self.assertEqual(l_k, {0: 0, 1: 1})
+
+    def test_find_odd_neighbor(self):
+        graph = nx.Graph([(1, 2), (2, 3), (3, 4), (4, 5), (5, 6), (3, 6), (1, 6)])
+        odd_neighbors = find_odd_neighbor(graph, graph.nodes, {2, 4, 6})
+        self.assertEqual(odd_neighbors, [3])
+        odd_neighbors = find_odd_neighbor(graph, {1, 2, 4, 5}, {2, 6})
+        self.assertEqual(set(odd_neighbors), {5})
+
 
 if __name__ == "__main__":
     unittest.main()
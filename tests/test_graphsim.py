@@ -127,6 +127,30 @@ class TestGraphSim(unittest.TestCase):
         exp_g = GraphState(nodes=np.arange(nqubit), edges=exp_edges)
         self.assertTrue(is_graphs_equal(g, exp_g))
 
+    def test_pivot(self):
+        nqubit = 7
+        edges = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 0), (1, 5), (2, 5), (5, 6), (3, 6)]
+        g = GraphState(nodes=np.arange(nqubit), edges=edges, use_rustworkx=self.use_rustworkx)
+        g.pivot(1, 2)
+        exp_g = GraphState(nodes=np.arange(nqubit), edges=edges)
+        exp_g.local_complement(1)
+        exp_g.local_complement(2)
+        exp_g.local_complement(1)
+        self.assertTrue(is_graphs_equal(g, exp_g))
+        with self.assertRaises(ValueError):
+            g.pivot(0, 6)
+
+    def test_neighbors_with_node_labels(self):
+        edges = [(10, 11), (11, 12), (12, 13)]
+        g = GraphState(nodes=[10, 11, 12, 13], edges=edges, use_rustworkx=self.use_rustworkx)
+        g.remove_node(10)
+        g.add_edges_from([(20, 11), (20, 13)])
+        self.assertEqual(set(g.neighbors(11)), {12, 20})
+        self.assertEqual(set(g.neighbors(20)), {11, 13})
+        adjacency = {n: set(adj) for n, adj in g.adjacency()}
+        self.assertEqual(adjacency, {11: {12, 20}, 12: {11, 13}, 13: {12, 20}, 20: {11, 13}})
+        self.assertEqual(dict(g.degree()), {11: 2, 12: 2, 13: 2, 20: 2})
+
 
 @unittest.skipIf(sys.modules.get("rustworkx") is None, "rustworkx not installed")
 class TestGraphSimUtils(unittest.TestCase):
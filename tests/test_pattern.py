@@ -9,6 +9,8 @@ from graphix.pattern import CommandNode, Pattern
 from graphix.transpiler import Circuit
 
 SEED = 42
+# with the global seed set, rc.get_rand_circuit returns the same circuit on every call, so the
+# repeated runs below share one circuit and reference state and only repeat the pattern simulation.
 rc.set_seed(SEED)
 
 
@@ -52,16 +54,15 @@ class TestPattern(unittest.TestCase):
         state_mbqc = pattern.simulate_pattern()
         np.testing.assert_almost_equal(np.abs(np.dot(state_mbqc.flatten().conjugate(), state.flatten())), 1)
 
-    def test_minimize_space_graph_maxspace_with_flow(self):
-        max_qubits = 20
-        for nqubits in range(2, max_qubits):
-            depth = 5
-            pairs = [(i, np.mod(i + 1, nqubits)) for i in range(nqubits)]
-            circuit = rc.generate_gate(nqubits, depth, pairs)
-            pattern = circuit.transpile()
-            pattern.standardize(method="global")
-            pattern.minimize_space()
-            np.testing.assert_equal(pattern.max_space(), nqubits + 1)
+    @parameterized.expand([(nqubits,) for nqubits in range(2, 20)])
+    def test_minimize_space_graph_maxspace_with_flow(self, nqubits):
+        depth = 5
+        pairs = [(i, np.mod(i + 1, nqubits)) for i in range(nqubits)]
+        circuit = rc.generate_gate(nqubits, depth, pairs)
+        pattern = circuit.transpile()
+        pattern.standardize(method="global")
+        pattern.minimize_space()
+        np.testing.assert_equal(pattern.max_space(), nqubits + 1)
 
     def test_parallelize_pattern(self):
         nqubits = 2
@@ -77,13 +78,13 @@ class TestPattern(unittest.TestCase):
     def test_shift_signals(self):
         nqubits = 2
         depth = 1
+        circuit = rc.get_rand_circuit(nqubits, depth)
+        state = circuit.simulate_statevector()
         for i in range(10):
-            circuit = rc.get_rand_circuit(nqubits, depth)
             pattern = circuit.transpile()
             pattern.standardize(method="global")
             pattern.shift_signals(method="global")
             np.testing.assert_equal(pattern.is_standard(), True)
-            state = circuit.simulate_statevector()
             state_mbqc = pattern.simulate_pattern()
             np.testing.assert_almost_equal(np.abs(np.dot(state_mbqc.flatten().conjugate(), state.flatten())), 1)
 
@@ -93,14 +94,14 @@ class TestPattern(unittest.TestCase):
             self.skipTest("rustworkx not installed")
         nqubits = 3
         depth = 3
+        circuit = rc.get_rand_circuit(nqubits, depth)
+        state = circuit.simulate_statevector()
         for i in range(10):
-            circuit = rc.get_rand_circuit(nqubits, depth)
             pattern = circuit.transpile()
             pattern.standardize(method="global")
             pattern.shift_signals(method="global")
             pattern.perform_pauli_measurements(use_rustworkx=use_rustworkx)
             pattern.minimize_space()
-            state = circuit.simulate_statevector()
             state_mbqc = pattern.simulate_pattern()
             np.testing.assert_almost_equal(np.abs(np.dot(state_mbqc.flatten().conjugate(), state.flatten())), 1)
 
@@ -110,14 +111,14 @@ class TestPattern(unittest.TestCase):
             self.skipTest("rustworkx not installed")
         nqubits = 3
         depth = 3
+        circuit = rc.get_rand_circuit(nqubits, depth)
+        state = circuit.simulate_statevector()
         for i in range(10):
-            circuit = rc.get_rand_circuit(nqubits, depth)
             pattern = circuit.transpile()
             pattern.standardize(method="global")
             pattern.shift_signals(method="global")
             pattern.perform_pauli_measurements(use_rustworkx=use_rustworkx, leave_input=True)
             pattern.minimize_space()
-            state = circuit.simulate_statevector()
             state_mbqc = pattern.simulate_pattern()
             np.testing.assert_almost_equal(np.abs(np.dot(state_mbqc.flatten().conjugate(), state.flatten())), 1)
 
@@ -127,14 +128,14 @@ class TestPattern(unittest.TestCase):
             self.skipTest("rustworkx not installed")
         nqubits = 3
         depth = 3
+        circuit = rc.get_rand_circuit(nqubits, depth, use_rzz=True)
+        state = circuit.simulate_statevector()
         for i in range(10):
-            circuit = rc.get_rand_circuit(nqubits, depth, use_rzz=True)
             pattern = circuit.transpile(opt=True)
             pattern.standardize(method="global")
             pattern.shift_signals(method="global")
             pattern.perform_pauli_measurements(use_rustworkx=use_rustworkx)
             pattern.minimize_space()
-            state = circuit.simulate_statevector()
             state_mbqc = pattern.simulate_pattern()
             np.testing.assert_almost_equal(np.abs(np.dot(state_mbqc.flatten().conjugate(), state.flatten())), 1)
 
@@ -144,14 +145,14 @@ class TestPattern(unittest.TestCase):
             self.skipTest("rustworkx not installed")
         nqubits = 3
         depth = 3
+        circuit = rc.get_rand_circuit(nqubits, depth, use_rzz=True)
+        state = circuit.simulate_statevector()
         for i in range(10):
-            circuit = rc.get_rand_circuit(nqubits, depth, use_rzz=True)
             pattern = circuit.standardize_and_transpile(opt=True)
             pattern.standardize(method="global")
             pattern.shift_signals(method="global")
             pattern.perform_pauli_measurements(use_rustworkx=use_rustworkx)
             pattern.minimize_space()
-            state = circuit.simulate_statevector()
             state_mbqc = pattern.simulate_pattern()
             np.testing.assert_almost_equal(np.abs(np.dot(state_mbqc.flatten().conjugate(), state.flatten())), 1)
 
@@ -161,12 +162,12 @@ class TestPattern(unittest.TestCase):
             self.skipTest("rustworkx not installed")
         nqubits = 3
         depth = 3
+        circuit = rc.get_rand_circuit(nqubits, depth, use_rzz=True)
+        state = circuit.simulate_statevector()
         for i in range(10):
-            circuit = rc.get_rand_circuit(nqubits, depth, use_rzz=True)
             pattern = circuit.standardize_and_transpile(opt=True)
             pattern.perform_pauli_measurements(use_rustworkx=use_rustworkx)
             pattern.minimize_space()
-            state = circuit.simulate_statevector()
             state_mbqc = pattern.simulate_pattern()
             np.testing.assert_almost_equal(np.abs(np.dot(state_mbqc.flatten().conjugate(), state.flatten())), 1)
 
@@ -334,8 +335,9 @@ class TestLocalPattern(unittest.TestCase):
     def test_standardize(self):
         nqubits = 5
         depth = 4
+        circuit = rc.get_rand_circuit(nqubits, depth)
+        state_ref = circuit.simulate_statevector()
         for i in range(10):
-            circuit = rc.get_rand_circuit(nqubits, depth)
             pattern = circuit.transpile()
             localpattern = pattern.get_local_pattern()
             localpattern.standardize()
@@ -343,14 +345,14 @@ class TestLocalPattern(unittest.TestCase):
             np.testing.assert_equal(pattern.is_standard(), True)
             pattern.minimize_space()
             state_p = pattern.simulate_pattern()
-            state_ref = circuit.simulate_statevector()
             np.testing.assert_almost_equal(np.abs(np.dot(state_p.flatten().conjugate(), state_ref.flatten())), 1)
 
     def test_shift_signals(self):
         nqubits = 5
         depth = 4
+        circuit = rc.get_rand_circuit(nqubits, depth)
+        state_ref = circuit.simulate_statevector()
         for i in range(10):
-            circuit = rc.get_rand_circuit(nqubits, depth)
             pattern = circuit.transpile()
             localpattern = pattern.get_local_pattern()
             localpattern.standardize()
@@ -359,20 +361,19 @@ class TestLocalPattern(unittest.TestCase):
             np.testing.assert_equal(pattern.is_standard(), True)
             pattern.minimize_space()
             state_p = pattern.simulate_pattern()
-            state_ref = circuit.simulate_statevector()
             np.testing.assert_almost_equal(np.abs(np.dot(state_p.flatten().conjugate(), state_ref.flatten())), 1)
 
     def test_standardize_and_shift_signals(self):
         nqubits = 5
         depth = 4
+        circuit = rc.get_rand_circuit(nqubits, depth)
+        state_ref = circuit.simulate_statevector()
         for i in range(10):
-            circuit = rc.get_rand_circuit(nqubits, depth)
             pattern = circuit.transpile()
             pattern.standardize_and_shift_signals()
             np.testing.assert_equal(pattern.is_standard(), True)
             pattern.minimize_space()
             state_p = pattern.simulate_pattern()
-            state_ref = circuit.simulate_statevector()
             np.testing.assert_almost_equal(np.abs(np.dot(state_p.flatten().conjugate(), state_ref.flatten())), 1)
 
     def test_mixed_pattern_operations(self):
@@ -388,9 +389,9 @@ class TestLocalPattern(unittest.TestCase):
         ]
         nqubits = 3
         depth = 2
+        circuit = rc.get_rand_circuit(nqubits, depth)
+        state_ref = circuit.simulate_statevector()
         for i in range(3):
-            circuit = rc.get_rand_circuit(nqubits, depth)
-            state_ref = circuit.simulate_statevector()
             for process in processes:
                 pattern = circuit.transpile()
                 for operation in process:
@@ -406,28 +407,28 @@ class TestLocalPattern(unittest.TestCase):
     def test_opt_transpile_standardize(self):
         nqubits = 5
         depth = 4
+        circuit = rc.get_rand_circuit(nqubits, depth)
+        state_ref = circuit.simulate_statevector()
         for i in range(10):
-            circuit = rc.get_rand_circuit(nqubits, depth)
             pattern = circuit.transpile(opt=True)
             pattern.standardize(method="local")
             np.testing.assert_equal(pattern.is_standard(), True)
             pattern.minimize_space()
             state_p = pattern.simulate_pattern()
-            state_ref = circuit.simulate_statevector()
             np.testing.assert_almost_equal(np.abs(np.dot(state_p.flatten().conjugate(), state_ref.flatten())), 1)
 
     def test_opt_transpile_shift_signals(self):
         nqubits = 5
         depth = 4
+        circuit = rc.get_rand_circuit(nqubits, depth)
+        state_ref = circuit.simulate_statevector()
         for i in range(10):
-            circuit = rc.get_rand_circuit(nqubits, depth)
             pattern = circuit.transpile(opt=True)
             pattern.standardize(method="local")
             pattern.shift_signals(method="local")
             np.testing.assert_equal(pattern.is_standard(), True)
             pattern.minimize_space()
             state_p = pattern.simulate_pattern()
-            state_ref = circuit.simulate_statevector()
             np.testing.assert_almost_equal(np.abs(np.dot(state_p.flatten().conjugate(), state_ref.flatten())), 1)
 
     def test_node_is_standardized(self):
@@ -445,8 +446,8 @@ class TestLocalPattern(unittest.TestCase):
     def test_localpattern_is_standard(self):
         nqubits = 5
         depth = 4
+        circuit = rc.get_rand_circuit(nqubits, depth)
         for i in range(10):
-            circuit = rc.get_rand_circuit(nqubits, depth)
             localpattern = circuit.transpile().get_local_pattern()
             result1 = localpattern.is_standard()
             localpattern.standardize()